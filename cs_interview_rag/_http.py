@@ -0,0 +1,17 @@
+# Shared HTTP session with connection pooling and keep-alive
+#
+# Module-level so Ollama (and any other plain-requests callers) reuse
+# TCP connections instead of paying a handshake per request.
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+SESSION = requests.Session()
+
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
@@ -1,4 +1,4 @@
 # Config module
-from .settings import settings, Settings
+from .settings import settings, Settings, get_settings
 
-__all__ = ["settings", "Settings"]
+__all__ = ["settings", "Settings", "get_settings"]
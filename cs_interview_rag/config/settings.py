@@ -1,6 +1,7 @@
 # Configuration settings for CS Interview RAG Assistant
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -31,6 +32,21 @@ class Settings(BaseSettings):
         default=384,
         description="Dimension of embedding vectors"
     )
+    embedding_device: Literal["auto", "cpu", "cuda", "mps"] = Field(
+        default="auto",
+        description=(
+            "Device for embedding inference; 'auto' picks cuda/mps when "
+            "available and falls back to cpu"
+        )
+    )
+    embedding_backend: Literal["st", "onnx", "model2vec"] = Field(
+        default="st",
+        description=(
+            "Embedding backend: 'st' (sentence-transformers), 'onnx' "
+            "(ONNX Runtime, faster on CPU), or 'model2vec' (static "
+            "embeddings, 20-40x faster with a small accuracy tradeoff)"
+        )
+    )
     
     # Chunking Configuration
     chunk_size: int = Field(
@@ -64,5 +80,12 @@ class Settings(BaseSettings):
         extra = "ignore"
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the Settings instance once and reuse it (env parsing and
+    pydantic validation are not free on repeated construction)."""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -0,0 +1,49 @@
+# Numba-accelerated kernels for embedding post-processing
+#
+# L2 normalization is on the hot path of every ingest batch and every
+# query. The numba versions run in place with no temporaries; when numba
+# is not installed we fall back to equivalent NumPy implementations.
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def normalize_2d(x: np.ndarray) -> None:
+        """L2-normalize each row of a (N, dim) float32 array in place."""
+        for i in prange(x.shape[0]):
+            s = 0.0
+            for j in range(x.shape[1]):
+                s += x[i, j] * x[i, j]
+            inv = 1.0 / (math.sqrt(s) + 1e-12)
+            for j in range(x.shape[1]):
+                x[i, j] *= inv
+
+    @njit(fastmath=True, cache=True)
+    def normalize_1d(x: np.ndarray) -> None:
+        """L2-normalize a 1-D float32 array in place."""
+        s = 0.0
+        for j in range(x.shape[0]):
+            s += x[j] * x[j]
+        inv = 1.0 / (math.sqrt(s) + 1e-12)
+        for j in range(x.shape[0]):
+            x[j] *= inv
+
+else:
+
+    def normalize_2d(x: np.ndarray) -> None:
+        """L2-normalize each row of a (N, dim) float32 array in place."""
+        norms = np.linalg.norm(x, axis=1, keepdims=True)
+        x /= norms + 1e-12
+
+    def normalize_1d(x: np.ndarray) -> None:
+        """L2-normalize a 1-D float32 array in place."""
+        x /= np.linalg.norm(x) + 1e-12
@@ -1,18 +1,65 @@
 # Embedder - Generate embeddings using sentence-transformers
+import os
 from typing import List, Union
 import numpy as np
 
+from ._kernels import normalize_1d, normalize_2d
+
 
 class Embedder:
-    """Generate embeddings using sentence-transformers."""
-    
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    """Generate embeddings using sentence-transformers, ONNX Runtime,
+    or model2vec static embeddings."""
+
+    # Default static embedding model when backend="model2vec" is used
+    # with a sentence-transformers model name
+    DEFAULT_MODEL2VEC_MODEL = "minishlab/potion-base-8M"
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        backend: str = "st",
+        device: str = "auto"
+    ):
         """
-        Initialize the embedder with a sentence-transformer model.
-        
+        Initialize the embedder.
+
+        The model itself is loaded lazily on first use, so commands that
+        never compute an embedding (status, clear, --help) don't pay the
+        torch import and model load cost.
+
         Args:
-            model_name: Name of the sentence-transformer model
+            model_name: Name of the embedding model
+            backend: "st" for sentence-transformers (PyTorch), "onnx"
+                for ONNX Runtime via optimum (several times faster for
+                MiniLM-style encoders on CPU), or "model2vec" for static
+                embeddings (20-40x faster than transformer inference,
+                with a small retrieval-accuracy tradeoff)
+            device: "auto" to pick cuda/mps when available, or an
+                explicit torch device string (st backend only)
         """
+        self.model_name = model_name
+        self.backend = backend
+        self.device = device
+        self._model = None
+        self._tokenizer = None  # Only used by the onnx backend
+        self._dimension = None
+
+    @property
+    def model(self):
+        """The embedding model, loaded on first access."""
+        if self._model is None:
+            if self.backend == "onnx":
+                self._load_onnx()
+            elif self.backend == "model2vec":
+                self._load_model2vec()
+            else:
+                self._load_st()
+            print(f"Loaded embedding model: {self.model_name} "
+                  f"(backend: {self.backend}, dimension: {self._dimension})")
+        return self._model
+
+    def _load_st(self):
+        """Load the model via sentence-transformers (PyTorch)."""
         try:
             from sentence_transformers import SentenceTransformer
         except ImportError:
@@ -20,68 +67,199 @@ class Embedder:
                 "sentence-transformers is required. "
                 "Install with: pip install sentence-transformers"
             )
-        
-        self.model_name = model_name
-        self.model = SentenceTransformer(model_name)
-        self.dimension = self.model.get_sentence_embedding_dimension()
-        print(f"Loaded embedding model: {model_name} (dimension: {self.dimension})")
-    
-    def embed_text(self, text: str) -> List[float]:
+
+        self._model = SentenceTransformer(self.model_name, device=self._resolve_device())
+        self._dimension = self._model.get_sentence_embedding_dimension()
+
+        # Make sure the Rust-backed fast tokenizer is active; the slow
+        # Python tokenizer adds milliseconds to every short-query encode
+        tokenizer = getattr(self._model, "tokenizer", None)
+        if tokenizer is not None and not getattr(tokenizer, "is_fast", True):
+            try:
+                from transformers import AutoTokenizer
+                self._model.tokenizer = AutoTokenizer.from_pretrained(
+                    self.model_name, use_fast=True
+                )
+                tokenizer = self._model.tokenizer
+            except Exception as e:
+                print(f"Warning: could not load fast tokenizer: {e}")
+        if tokenizer is not None:
+            print(f"Tokenizer is_fast={getattr(tokenizer, 'is_fast', False)}")
+
+    def _resolve_device(self) -> str:
+        """Resolve "auto" to the fastest available torch device."""
+        if self.device != "auto":
+            return self.device
+
+        import torch
+        if torch.cuda.is_available():
+            return "cuda"
+        if getattr(torch.backends, "mps", None) is not None \
+                and torch.backends.mps.is_available():
+            return "mps"
+        return "cpu"
+
+    def _load_onnx(self):
+        """Load the model via optimum/ONNX Runtime with fused kernels."""
+        try:
+            import onnxruntime as ort
+            from optimum.onnxruntime import ORTModelForFeatureExtraction
+            from transformers import AutoTokenizer
+        except ImportError:
+            raise ImportError(
+                "optimum and onnxruntime are required for the onnx backend. "
+                "Install with: pip install optimum[onnxruntime]"
+            )
+
+        # Bare model names resolve to the sentence-transformers hub namespace
+        model_id = self.model_name if "/" in self.model_name \
+            else f"sentence-transformers/{self.model_name}"
+
+        session_options = ort.SessionOptions()
+        session_options.graph_optimization_level = \
+            ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        session_options.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+
+        self._model = ORTModelForFeatureExtraction.from_pretrained(
+            model_id,
+            export=True,
+            session_options=session_options
+        )
+        self._tokenizer = AutoTokenizer.from_pretrained(model_id)
+        self._dimension = int(self._model.config.hidden_size)
+
+    def _load_model2vec(self):
+        """Load a model2vec static embedding model (lookup + mean pool)."""
+        try:
+            from model2vec import StaticModel
+        except ImportError:
+            raise ImportError(
+                "model2vec is required for the model2vec backend. "
+                "Install with: pip install model2vec"
+            )
+
+        # Sentence-transformers model names don't exist as static models;
+        # fall back to the default distilled model in that case
+        model_id = self.model_name if "/" in self.model_name \
+            else self.DEFAULT_MODEL2VEC_MODEL
+
+        self._model = StaticModel.from_pretrained(model_id)
+        self._dimension = int(self._model.dim) if hasattr(self._model, "dim") \
+            else int(self._model.encode(["probe"]).shape[1])
+
+    @property
+    def dimension(self) -> int:
+        """The embedding dimension (forces model load on first access)."""
+        if self._dimension is None:
+            _ = self.model
+        return self._dimension
+
+    def _encode(self, texts: List[str], batch_size: int) -> np.ndarray:
+        """Encode texts with the active backend, returning (N, dim) float32."""
+        if self.backend == "onnx":
+            return self._encode_onnx(texts, batch_size)
+
+        if self.backend == "model2vec":
+            # Table lookup + mean pool; already returns a numpy array
+            return np.asarray(self.model.encode(texts), dtype=np.float32)
+
+        # inference_mode disables autograd bookkeeping, which the ST
+        # library does not guarantee on its own
+        import torch
+        with torch.inference_mode():
+            return self.model.encode(
+                texts,
+                batch_size=batch_size,
+                show_progress_bar=len(texts) > 10,
+                convert_to_numpy=True
+            )
+
+    def _encode_onnx(self, texts: List[str], batch_size: int) -> np.ndarray:
+        """Tokenize -> ONNX session run -> mean pool -> L2 normalize."""
+        model = self.model  # Forces load of model + tokenizer
+
+        out = np.empty((len(texts), self.dimension), dtype=np.float32)
+
+        for i in range(0, len(texts), batch_size):
+            batch = texts[i:i + batch_size]
+            encoded = self._tokenizer(
+                batch,
+                padding=True,
+                truncation=True,
+                max_length=256,
+                return_tensors="np"
+            )
+            hidden = model(**encoded).last_hidden_state
+
+            # Mean pool over non-padding tokens, then L2 normalize
+            mask = encoded["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+            out[i:i + len(batch)] = pooled / np.clip(norms, 1e-12, None)
+
+        return out
+
+    def embed_text(self, text: str) -> np.ndarray:
         """
         Generate embedding for a single text.
-        
+
         Args:
             text: Text to embed
-            
+
         Returns:
-            Embedding as a list of floats
+            Embedding as a 1-D float32 numpy array
         """
         if not text or not text.strip():
             raise ValueError("Cannot embed empty text")
-        
-        embedding = self.model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
-    
-    def embed_batch(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+
+        embedding = np.ascontiguousarray(
+            self._encode([text], batch_size=1)[0], dtype=np.float32
+        )
+        normalize_1d(embedding)
+        return embedding
+
+    def embed_batch(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
         """
         Generate embeddings for multiple texts.
-        
+
+        Texts are sorted by length before encoding so that each mini-batch
+        contains similarly-sized inputs. This minimizes padding tokens per
+        batch ("smart batching"), which significantly speeds up CPU inference.
+
+        All texts must be non-empty: the chunker never emits empty chunks,
+        so the per-text filtering this method used to do was two wasted
+        O(N) passes on the ingestion path.
+
         Args:
-            texts: List of texts to embed
+            texts: List of non-empty texts to embed
             batch_size: Number of texts to process at once
-            
+
         Returns:
-            List of embeddings, each as a list of floats
+            Float32 numpy array of shape (len(texts), dimension) with
+            L2-normalized rows.
         """
         if not texts:
-            return []
-        
-        # Filter empty texts but track indices
-        valid_texts = []
-        valid_indices = []
-        for i, text in enumerate(texts):
-            if text and text.strip():
-                valid_texts.append(text)
-                valid_indices.append(i)
-        
-        if not valid_texts:
-            return [[] for _ in texts]
-        
-        # Generate embeddings
-        embeddings = self.model.encode(
-            valid_texts,
-            batch_size=batch_size,
-            show_progress_bar=len(valid_texts) > 10,
-            convert_to_numpy=True
-        )
-        
-        # Map back to original indices
-        result = [[] for _ in texts]
-        for i, idx in enumerate(valid_indices):
-            result[idx] = embeddings[i].tolist()
-        
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        assert all(text and text.strip() for text in texts), \
+            "embed_batch requires non-empty texts"
+
+        # Sort by length so each mini-batch pads to a similar length
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+
+        # Generate embeddings in length-sorted order
+        embeddings = self._encode([texts[i] for i in order], batch_size)
+
+        # Scatter back to the original order
+        result = np.empty((len(texts), self.dimension), dtype=np.float32)
+        result[order] = embeddings
+
+        # Normalize in place so cosine similarity reduces to a dot
+        # product downstream
+        normalize_2d(result)
+
         return result
-    
+
     def get_dimension(self) -> int:
         """Get the embedding dimension."""
         return self.dimension
@@ -1,22 +1,48 @@
 # Text Chunker - Split documents into overlapping chunks
-from typing import List, Dict, Any
+import re
+from bisect import bisect_right
+from typing import List, Iterator
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Chunk:
-    """Represents a text chunk with metadata."""
+    """Represents a text chunk.
+
+    Slots (no per-instance __dict__) keep large corpora compact:
+    a 10k-chunk ingest used to carry a metadata dict per chunk.
+    """
     content: str
     chunk_id: int
     source: str
     start_char: int
     end_char: int
-    metadata: Dict[str, Any]
+    chunk_size: int
+    total_chunks: int
+    vector_id: str
 
 
 class TextChunker:
     """Split text into overlapping chunks for embedding."""
-    
+
+    # Break markers in order of preference (paragraph > line > sentence > clause)
+    BREAK_MARKERS = ("\n\n", "\n", ". ", "! ", "? ", ", ")
+
+    # One compiled alternation finds every marker in a single C-level
+    # scan. The zero-width lookahead makes matches overlap-aware: every
+    # position is classified (group 1 prefers "\n\n" over "\n"), so a
+    # "\n\n" never consumes the newline that also serves as a "\n"
+    # boundary one position later
+    _BOUNDARY_RE = re.compile(
+        "(?=(" + "|".join(re.escape(m) for m in BREAK_MARKERS) + "))"
+    )
+
+    # Bytes twins for the ASCII fast path
+    BREAK_MARKERS_B = tuple(m.encode("ascii") for m in BREAK_MARKERS)
+    _BOUNDARY_RE_B = re.compile(
+        b"(?=(" + b"|".join(re.escape(m) for m in BREAK_MARKERS_B) + b"))"
+    )
+
     def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200):
         """
         Initialize the text chunker.
@@ -31,6 +57,36 @@ class TextChunker:
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
     
+    def _collect_boundaries(self, data) -> List[tuple]:
+        """Scan the text (str or bytes) once with the compiled boundary
+        regex and return (marker_length, sorted_offsets) pairs in
+        marker-preference order."""
+        if isinstance(data, bytes):
+            markers = self.BREAK_MARKERS_B
+            pattern = self._BOUNDARY_RE_B
+        else:
+            markers = self.BREAK_MARKERS
+            pattern = self._BOUNDARY_RE
+
+        occurrences = {marker: [] for marker in markers}
+        for match in pattern.finditer(data):
+            occurrences[match.group(1)].append(match.start())
+
+        # A position classified as "\n\n" is also a "\n" boundary; fold
+        # longer markers' offsets into their prefixes so every tier sees
+        # exactly the offsets an independent per-marker scan would
+        index = []
+        for marker in markers:
+            offsets = occurrences[marker]
+            extras = [
+                occurrences[other] for other in markers
+                if other != marker and other.startswith(marker)
+            ]
+            if any(extras):
+                offsets = sorted(offsets + [o for lst in extras for o in lst])
+            index.append((len(marker), offsets))
+        return index
+
     def chunk_text(self, text: str, source: str = "unknown") -> List[Chunk]:
         """
         Split text into overlapping chunks.
@@ -47,68 +103,82 @@ class TextChunker:
         
         # Clean up the text
         text = text.strip()
-        
-        chunks = []
+
+        # ASCII fast path: scan over bytes, which is one byte per char of
+        # memory traffic instead of CPython's wide str representation.
+        # Offsets are identical to character offsets for pure-ASCII text,
+        # so start_char/end_char are unaffected.
+        if text.isascii():
+            data = text.encode("ascii")
+        else:
+            data = text
+
+        # Precompute sorted boundary offsets once per document; rfind-ing
+        # each marker per chunk re-scans the window and goes quadratic on
+        # large documents
+        boundary_index = self._collect_boundaries(data)
+
+        # First pass: collect chunk spans only. Chunks are constructed
+        # afterwards so total_chunks is known up front instead of being
+        # patched into every chunk's metadata in a second mutation pass.
+        spans = []
         start = 0
-        chunk_id = 0
-        
-        while start < len(text):
+        length = len(data)
+
+        while start < length:
             # Calculate end position
-            end = min(start + self.chunk_size, len(text))
-            
+            end = min(start + self.chunk_size, length)
+
             # Try to break at a sentence or paragraph boundary
-            if end < len(text):
-                # Look for sentence boundaries (., !, ?) followed by space or newline
-                best_break = end
-                for break_char in ["\n\n", "\n", ". ", "! ", "? ", ", "]:
-                    last_break = text.rfind(break_char, start, end)
-                    if last_break > start + self.chunk_size // 2:
-                        best_break = last_break + len(break_char)
+            if end < length:
+                # Binary-search the last boundary within the window,
+                # preferring paragraph breaks over sentence/clause breaks
+                half = start + self.chunk_size // 2
+                for marker_len, offsets in boundary_index:
+                    i = bisect_right(offsets, end - marker_len) - 1
+                    if i >= 0 and offsets[i] > half:
+                        end = offsets[i] + marker_len
                         break
-                end = best_break
-            
-            # Extract chunk content
-            chunk_content = text[start:end].strip()
-            
+
+            # Extract chunk content (decode back on the bytes fast path)
+            chunk_content = data[start:end]
+            if isinstance(chunk_content, bytes):
+                chunk_content = chunk_content.decode("ascii")
+            chunk_content = chunk_content.strip()
+
             if chunk_content:
-                chunks.append(Chunk(
-                    content=chunk_content,
-                    chunk_id=chunk_id,
-                    source=source,
-                    start_char=start,
-                    end_char=end,
-                    metadata={
-                        "chunk_size": len(chunk_content),
-                        "total_chunks": -1  # Will be updated after processing
-                    }
-                ))
-                chunk_id += 1
-            
+                spans.append((chunk_content, start, end))
+
             # Move start position with overlap
             start = end - self.chunk_overlap
-            if start >= len(text) or start == end - self.chunk_overlap and end == len(text):
+            if start >= length or start == end - self.chunk_overlap and end == length:
                 break
-        
-        # Update total chunks count
-        for chunk in chunks:
-            chunk.metadata["total_chunks"] = len(chunks)
-        
-        return chunks
+
+        total = len(spans)
+        return [
+            Chunk(
+                content=content,
+                chunk_id=chunk_id,
+                source=source,
+                start_char=start_char,
+                end_char=end_char,
+                chunk_size=len(content),
+                total_chunks=total,
+                vector_id=f"{source}_chunk_{chunk_id}"
+            )
+            for chunk_id, (content, start_char, end_char) in enumerate(spans)
+        ]
     
-    def chunk_documents(self, documents) -> List[Chunk]:
+    def chunk_documents(self, documents) -> Iterator[Chunk]:
         """
-        Chunk multiple documents.
-        
+        Chunk multiple documents, yielding chunks as each document is
+        processed so only one document's chunks are resident at a time.
+
         Args:
-            documents: List of Document objects
-            
-        Returns:
-            List of all Chunk objects
+            documents: Iterable of Document objects
+
+        Yields:
+            Chunk objects
         """
-        all_chunks = []
-        
         for doc in documents:
-            chunks = self.chunk_text(doc.content, doc.source)
-            all_chunks.extend(chunks)
-        
-        return all_chunks
+            yield from self.chunk_text(doc.content, doc.source)
@@ -1,7 +1,9 @@
 # Document Loader - Load PDF, TXT, and Markdown files
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Dict, Any, Iterator
 from dataclasses import dataclass
 
 
@@ -57,54 +59,179 @@ class DocumentLoader:
         )
     
     def _load_pdf(self, path: Path) -> str:
-        """Extract text from a PDF file."""
+        """Extract text from a PDF file.
+
+        Prefers PyMuPDF (C-backed, 5-10x faster at text extraction) and
+        falls back to pure-Python pypdf when it isn't installed.
+        """
+        try:
+            import fitz  # PyMuPDF
+        except ImportError:
+            fitz = None
+
+        text_parts = []
+
+        if fitz is not None:
+            with fitz.open(str(path)) as doc:
+                for page in doc:
+                    text = page.get_text("text")
+                    if text:
+                        text_parts.append(text)
+            return "\n\n".join(text_parts)
+
         try:
             from pypdf import PdfReader
         except ImportError:
             raise ImportError("pypdf is required for PDF support. Install with: pip install pypdf")
-        
+
         reader = PdfReader(str(path))
-        text_parts = []
-        
+
         for page in reader.pages:
             text = page.extract_text()
             if text:
                 text_parts.append(text)
-        
+
         return "\n\n".join(text_parts)
     
+    def iter_pages(self, file_path: str) -> Iterator[Document]:
+        """
+        Yield one Document per PDF page instead of concatenating the
+        whole file into a single string.
+
+        Page-sized documents keep peak memory at O(one page) for large
+        PDFs, and interview PDFs tend to have per-page logical units so
+        per-page chunk boundaries are acceptable.
+
+        Args:
+            file_path: Path to the PDF file
+
+        Yields:
+            Document objects with source "<name>#p<page>"
+        """
+        path = Path(file_path)
+
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        file_size = path.stat().st_size
+
+        try:
+            import fitz  # PyMuPDF
+        except ImportError:
+            fitz = None
+
+        if fitz is not None:
+            with fitz.open(str(path)) as doc:
+                for i, page in enumerate(doc):
+                    text = page.get_text("text")
+                    if text and text.strip():
+                        yield self._page_document(path, i, text, file_size)
+            return
+
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            raise ImportError("pypdf is required for PDF support. Install with: pip install pypdf")
+
+        reader = PdfReader(str(path))
+        for i, page in enumerate(reader.pages):
+            text = page.extract_text()
+            if text and text.strip():
+                yield self._page_document(path, i, text, file_size)
+
+    def _page_document(self, path: Path, page_index: int, text: str, file_size: int) -> Document:
+        """Build a Document for a single PDF page."""
+        return Document(
+            content=text,
+            source=f"{path.name}#p{page_index + 1}",
+            metadata={
+                "file_path": str(path.absolute()),
+                "file_type": ".pdf",
+                "file_size": file_size,
+                "page": page_index + 1
+            }
+        )
+
     def _load_text(self, path: Path) -> str:
         """Load text from a plain text or markdown file."""
         with open(path, "r", encoding="utf-8") as f:
             return f.read()
     
-    def load_directory(self, directory_path: str) -> List[Document]:
+    def load_directory(self, directory_path: str) -> Iterator[Document]:
         """
-        Load all supported documents from a directory.
-        
+        Load all supported documents from a directory, yielding them as
+        they finish loading.
+
+        Yielding (instead of returning a list) keeps only a bounded number
+        of documents in memory at once, so corpora larger than RAM can be
+        ingested.
+
         Args:
             directory_path: Path to the directory
-            
-        Returns:
-            List of Document objects
+
+        Yields:
+            Document objects
         """
         path = Path(directory_path)
-        
+
         if not path.exists():
             raise FileNotFoundError(f"Directory not found: {directory_path}")
-        
+
         if not path.is_dir():
             raise ValueError(f"Not a directory: {directory_path}")
-        
-        documents = []
-        
-        for file_path in path.rglob("*"):
-            if file_path.is_file() and file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS:
+
+        file_paths = [
+            p for p in path.rglob("*")
+            if p.is_file() and p.suffix.lower() in self.SUPPORTED_EXTENSIONS
+        ]
+
+        if not file_paths:
+            return
+
+        # PDFs are streamed page-by-page (below) so a large file never
+        # becomes one giant string; everything else goes through the pool
+        pdf_paths = [p for p in file_paths if p.suffix.lower() == ".pdf"]
+        text_paths = [p for p in file_paths if p.suffix.lower() != ".pdf"]
+
+        for pdf_path in pdf_paths:
+            try:
+                num_pages = 0
+                for doc in self.iter_pages(str(pdf_path)):
+                    num_pages += 1
+                    yield doc
+                print(f"  Loaded: {pdf_path.name} ({num_pages} pages)")
+            except Exception as e:
+                print(f"  Warning: Could not load {pdf_path.name}: {e}")
+
+        if not text_paths:
+            return
+
+        # Load files in parallel: text reads are pure I/O, so threads
+        # overlap well. Keep at most 2x max_workers futures in flight so
+        # completed documents don't pile up faster than the consumer
+        # drains them.
+        max_workers = min(32, (os.cpu_count() or 1) * 2, len(text_paths))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            paths_iter = iter(text_paths)
+            pending = {
+                executor.submit(self.load_file, str(p)): p
+                for p in islice(paths_iter, max_workers * 2)
+            }
+
+            while pending:
+                future = next(as_completed(pending))
+                file_path = pending.pop(future)
                 try:
-                    doc = self.load_file(str(file_path))
-                    documents.append(doc)
+                    doc = future.result()
                     print(f"  Loaded: {file_path.name}")
                 except Exception as e:
                     print(f"  Warning: Could not load {file_path.name}: {e}")
-        
-        return documents
+                    doc = None
+
+                next_path = next(paths_iter, None)
+                if next_path is not None:
+                    pending[executor.submit(self.load_file, str(next_path))] = next_path
+
+                if doc is not None:
+                    yield doc
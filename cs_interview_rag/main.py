@@ -14,8 +14,10 @@ Usage:
 """
 
 import argparse
+import logging
 import sys
 import os
+from functools import lru_cache
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -26,10 +28,15 @@ from vectorstore import EndeeVectorStore
 from rag import RAGPipeline
 
 
+@lru_cache(maxsize=1)
 def create_pipeline() -> RAGPipeline:
-    """Create and configure the RAG pipeline."""
+    """Create and configure the RAG pipeline (built once per process)."""
     # Initialize embedder
-    embedder = Embedder(model_name=settings.embedding_model)
+    embedder = Embedder(
+        model_name=settings.embedding_model,
+        backend=settings.embedding_backend,
+        device=settings.embedding_device
+    )
     
     # Initialize Endee vector store
     vector_store = EndeeVectorStore(
@@ -93,8 +100,38 @@ def cmd_query(args):
     return 0
 
 
+def run_batch_questions(pipeline, questions):
+    """Answer a list of questions, embedding them all in one batch.
+
+    Batch-embedding up front amortizes the per-call encoder overhead,
+    which matters when questions are piped in from a file or script.
+    """
+    questions = [q.strip() for q in questions if q.strip()]
+    if not questions:
+        print("No questions to answer.")
+        return 0
+
+    embeddings = pipeline.embedder.embed_batch(questions)
+
+    for question, embedding in zip(questions, embeddings):
+        pipeline.query_with_embedding(question, embedding)
+
+    return 0
+
+
 def cmd_interactive(args):
     """Interactive Q&A mode."""
+    # Batch mode: questions from a file or piped stdin are embedded in
+    # one shot instead of one encoder call per question
+    if args.batch_file:
+        pipeline = create_pipeline()
+        with open(args.batch_file, "r", encoding="utf-8") as f:
+            return run_batch_questions(pipeline, f.read().splitlines())
+
+    if not sys.stdin.isatty():
+        pipeline = create_pipeline()
+        return run_batch_questions(pipeline, sys.stdin.read().splitlines())
+
     print("\n" + "="*60)
     print("CS INTERVIEW PREP - INTERACTIVE MODE")
     print("="*60)
@@ -121,12 +158,18 @@ def cmd_interactive(args):
                 print("  exit/quit/q - Exit interactive mode")
                 print("  help        - Show this help message")
                 print("  clear       - Clear the screen")
+                print("  cache-clear - Drop cached query embeddings")
                 print("\nOr just type your CS question!")
                 continue
-            
+
             if question.lower() == 'clear':
                 os.system('cls' if os.name == 'nt' else 'clear')
                 continue
+
+            if question.lower() == 'cache-clear':
+                pipeline.clear_query_cache()
+                print("Query embedding cache cleared.")
+                continue
             
             # Query the RAG system
             response = pipeline.query(question)
@@ -176,6 +219,8 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=__doc__
     )
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Show debug-level progress output (e.g. per-batch upserts)')
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
@@ -192,7 +237,9 @@ def main():
                               help='Number of chunks to retrieve (default: 5)')
     
     # Interactive command
-    subparsers.add_parser('interactive', help='Interactive Q&A mode')
+    interactive_parser = subparsers.add_parser('interactive', help='Interactive Q&A mode')
+    interactive_parser.add_argument('--batch-file', default=None,
+                                    help='Answer all questions from a file (one per line)')
     
     # Clear command
     subparsers.add_parser('clear', help='Clear the vector index')
@@ -201,7 +248,14 @@ def main():
     subparsers.add_parser('status', help='Show index status')
     
     args = parser.parse_args()
-    
+
+    # Lifecycle and progress messages (index creation, upsert progress)
+    # come through the logging module; without a handler the root
+    # last-resort handler drops everything below WARNING
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.verbose:
+        logging.getLogger('vectorstore').setLevel(logging.DEBUG)
+
     if args.command is None:
         parser.print_help()
         return 1
@@ -1,7 +1,11 @@
 # RAG Pipeline - Retrieval-Augmented Generation for CS Interview Prep
+import io
+import json
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 
+from _http import SESSION
 from ingestion import DocumentLoader, TextChunker
 from embeddings import Embedder
 from vectorstore import EndeeVectorStore
@@ -32,6 +36,10 @@ Context from study materials:
 ---
 Answer the following question based ONLY on the context above."""
 
+# Pre-split around the context slot so the full prompt can be assembled
+# in one concatenation instead of format() + f-string re-copies
+_PROMPT_PREFIX, _PROMPT_SUFFIX = SYSTEM_PROMPT.split("{context}")
+
 
 class RAGPipeline:
     """
@@ -76,18 +84,28 @@ class RAGPipeline:
         self.document_loader = DocumentLoader()
         self.chunker = TextChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
         
+        # Cache query embeddings so re-asked questions skip the encoder
+        self._embed_query = lru_cache(maxsize=256)(self._embed_query_uncached)
+
         # Initialize LLM client
         self._llm_client = None
         self._llm_type = None  # 'ollama' or 'gemini'
         self._init_llm()
+
+    def _embed_query_uncached(self, question: str):
+        """Embed a query string (wrapped by an LRU cache per instance)."""
+        return self.embedder.embed_text(question)
+
+    def clear_query_cache(self) -> None:
+        """Drop all cached query embeddings."""
+        self._embed_query.cache_clear()
     
     def _init_llm(self):
         """Initialize the LLM client. Tries Ollama first (local), then Gemini."""
         # Try Ollama first (local, no rate limits)
         try:
-            import requests
             # Check if Ollama is running
-            response = requests.get("http://localhost:11434/api/tags", timeout=2)
+            response = SESSION.get("http://localhost:11434/api/tags", timeout=2)
             if response.status_code == 200:
                 self._llm_type = 'ollama'
                 print(f"LLM initialized: Ollama ({self.llm_model})")
@@ -111,76 +129,126 @@ class RAGPipeline:
         
         print("No LLM available. Install Ollama or configure GOOGLE_API_KEY.")
     
+    # Number of chunks to embed and upsert per streaming batch
+    INGEST_BATCH_SIZE = 256
+
     def ingest_documents(self, directory: str, recreate_index: bool = False) -> int:
         """
         Ingest documents from a directory into Endee.
-        
+
+        Documents are streamed through the chunker and embedder in
+        fixed-size batches, so peak memory is bounded by the batch size
+        rather than the corpus size.
+
         Args:
             directory: Path to directory containing documents
             recreate_index: If True, delete and recreate the index
-            
+
         Returns:
             Number of chunks ingested
         """
         print(f"\n{'='*50}")
         print("DOCUMENT INGESTION PIPELINE")
         print(f"{'='*50}")
-        
-        # Step 1: Load documents
-        print(f"\n[1/4] Loading documents from: {directory}")
-        documents = self.document_loader.load_directory(directory)
-        print(f"      Loaded {len(documents)} documents")
-        
-        if not documents:
+
+        # Step 1: Stream documents -> chunks -> embeddings -> Endee
+        print(f"\n[1/2] Streaming documents from: {directory}")
+
+        num_docs = 0
+        num_stored = 0
+        batch_chunks = []
+        batch_texts = []
+
+        # The index is prepared lazily, right before the first batch is
+        # upserted: an empty directory then leaves any existing index
+        # untouched instead of recreating it and storing nothing
+        index_ready = False
+
+        def _store(chunks, texts):
+            nonlocal index_ready
+            if not index_ready:
+                print(f"\n[2/2] Preparing Endee index...")
+                self.vector_store.create_index(recreate=recreate_index)
+                index_ready = True
+            return self._embed_and_store(chunks, texts)
+
+        # Collect chunks and their texts in one pass so the batch isn't
+        # re-walked just to pull out .content before embedding
+        for doc in self.document_loader.load_directory(directory):
+            num_docs += 1
+            for chunk in self.chunker.chunk_text(doc.content, doc.source):
+                batch_chunks.append(chunk)
+                batch_texts.append(chunk.content)
+                if len(batch_chunks) >= self.INGEST_BATCH_SIZE:
+                    num_stored += _store(batch_chunks, batch_texts)
+                    batch_chunks = []
+                    batch_texts = []
+
+        if batch_chunks:
+            num_stored += _store(batch_chunks, batch_texts)
+
+        if num_docs == 0:
             print("No documents found!")
             return 0
-        
-        # Step 2: Chunk documents
-        print(f"\n[2/4] Chunking documents...")
-        chunks = self.chunker.chunk_documents(documents)
-        print(f"      Created {len(chunks)} chunks")
-        
-        # Step 3: Generate embeddings
-        print(f"\n[3/4] Generating embeddings...")
-        texts = [chunk.content for chunk in chunks]
-        embeddings = self.embedder.embed_batch(texts)
-        print(f"      Generated {len(embeddings)} embeddings")
-        
-        # Step 4: Store in Endee
-        print(f"\n[4/4] Storing in Endee vector database...")
-        self.vector_store.create_index(recreate=recreate_index)
-        num_stored = self.vector_store.upsert_chunks(chunks, embeddings)
-        
+
+        print(f"      Processed {num_docs} documents")
+
         print(f"\n{'='*50}")
         print(f"INGESTION COMPLETE: {num_stored} chunks stored in Endee")
         print(f"{'='*50}\n")
-        
+
         return num_stored
+
+    def _embed_and_store(self, chunks, texts) -> int:
+        """Embed one batch of chunk texts and upsert it into the vector store."""
+        embeddings = self.embedder.embed_batch(texts)
+        return self.vector_store.upsert_chunks(chunks, embeddings)
     
     def query(self, question: str, top_k: Optional[int] = None) -> RAGResponse:
         """
         Query the RAG system with a question.
-        
+
         Args:
             question: The user's question
             top_k: Number of chunks to retrieve (overrides default)
-            
+
+        Returns:
+            RAGResponse with answer and sources
+        """
+        # Normalize the cache key so trivially re-phrased duplicates hit
+        # (the embedding model is uncased, so this doesn't change results)
+        query_embedding = self._embed_query(question.strip().lower())
+        return self.query_with_embedding(question, query_embedding, top_k=top_k)
+
+    def query_with_embedding(
+        self,
+        question: str,
+        query_embedding,
+        top_k: Optional[int] = None
+    ) -> RAGResponse:
+        """
+        Query the RAG system with a pre-computed query embedding.
+
+        Useful for batch workloads where many questions are embedded in
+        one embed_batch call up front.
+
+        Args:
+            question: The user's question
+            query_embedding: Embedding vector for the question
+            top_k: Number of chunks to retrieve (overrides default)
+
         Returns:
             RAGResponse with answer and sources
         """
         k = top_k or self.top_k
-        
+
         print(f"\n{'='*50}")
         print("RAG QUERY PIPELINE")
         print(f"{'='*50}")
         print(f"Question: {question}")
-        
-        # Step 1: Embed the query
-        print(f"\n[1/3] Embedding query...")
-        query_embedding = self.embedder.embed_text(question)
-        
-        # Step 2: Search Endee for similar chunks
-        print(f"[2/3] Searching Endee (top_k={k})...")
+
+        # Step 1: Search Endee for similar chunks
+        print(f"\n[1/2] Searching Endee (top_k={k})...")
         search_results = self.vector_store.search(query_embedding, top_k=k)
         print(f"      Found {len(search_results)} relevant chunks")
         
@@ -192,44 +260,58 @@ class RAGPipeline:
                 retrieved_chunks=0
             )
         
-        # Build context from retrieved chunks
-        context_parts = []
+        # Build context and sources in one pass; StringIO avoids
+        # re-allocating the growing context string per chunk
+        buf = io.StringIO()
         sources = []
         for i, result in enumerate(search_results, 1):
-            context_parts.append(f"[{i}] From '{result.source}' (similarity: {result.similarity:.3f}):\n{result.content}")
+            if i > 1:
+                buf.write("\n\n---\n\n")
+            buf.write(f"[{i}] From '{result.source}' (similarity: {result.similarity:.3f}):\n{result.content}")
             sources.append({
                 "source": result.source,
                 "similarity": result.similarity,
                 "preview": result.content[:150] + "..." if len(result.content) > 150 else result.content
             })
+
+        context = buf.getvalue()
         
-        context = "\n\n---\n\n".join(context_parts)
-        
-        # Step 3: Generate answer using LLM
-        print(f"[3/3] Generating answer with LLM...")
+        # Step 2: Generate answer using LLM
+        print(f"[2/2] Generating answer with LLM...")
         
         if self._llm_type is None:
             # No LLM available, return retrieved context
             answer = f"Retrieved context (LLM not configured):\n\n{context}"
         else:
             try:
-                # Build prompt with context
-                prompt = SYSTEM_PROMPT.format(context=context)
-                full_prompt = f"{prompt}\n\nQuestion: {question}\n\nAnswer:"
+                # Assemble the full prompt in a single concatenation
+                full_prompt = (
+                    f"{_PROMPT_PREFIX}{context}{_PROMPT_SUFFIX}"
+                    f"\n\nQuestion: {question}\n\nAnswer:"
+                )
                 
                 if self._llm_type == 'ollama':
-                    # Use Ollama API
-                    import requests
-                    response = requests.post(
+                    # Use Ollama API over the pooled session, streaming so
+                    # the client reads tokens while the model generates
+                    response = SESSION.post(
                         "http://localhost:11434/api/generate",
                         json={
                             "model": self.llm_model,
                             "prompt": full_prompt,
-                            "stream": False
+                            "stream": True
                         },
-                        timeout=180  # Increased for first-time model loading
+                        timeout=180,  # Increased for first-time model loading
+                        stream=True
                     )
-                    answer = response.json().get("response", "No response from Ollama")
+                    parts = []
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        data = json.loads(line)
+                        parts.append(data.get("response", ""))
+                        if data.get("done"):
+                            break
+                    answer = "".join(parts) or "No response from Ollama"
                 else:
                     # Use Gemini
                     response = self._llm_client.generate_content(full_prompt)
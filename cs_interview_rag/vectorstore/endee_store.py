@@ -1,11 +1,42 @@
 # Endee Vector Store - Integration with Endee vector database
-from typing import List, Dict, Any, Optional
+import base64
+import functools
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass
+# Pulls all needed chunk attributes in one C-level call per chunk
+_chunk_fields = attrgetter("source", "chunk_id", "content", "start_char", "end_char")
+
+logger = logging.getLogger(__name__)
+
+# Projection sentinel for the id+score-only search fast path
+_ID_SIMILARITY = frozenset({"id", "similarity"})
+
+
+@functools.lru_cache(maxsize=128)
+def _build_source_filter(source: str) -> tuple:
+    """Build the filter expression for a source, memoized because apps
+    tend to query the same handful of sources over and over. Returned
+    as a tuple so cached values stay immutable; callers listify."""
+    return ({"source": {"$eq": source}},)
+
+
+@dataclass(slots=True, frozen=True)
 class SearchResult:
-    """Represents a search result from Endee."""
+    """Represents a search result from Endee.
+
+    Slots drop the per-instance __dict__ and frozen makes results
+    safely shareable across the threads that produce them.
+    """
     id: str
     similarity: float
     content: str
@@ -23,22 +54,42 @@ class EndeeVectorStore:
     - Metadata storage and filtering capabilities
     - Multiple quantization levels for speed/accuracy tradeoffs
     """
-    
+
+    # Concurrency for batched upserts
+    UPSERT_WORKERS = 8
+    MAX_INFLIGHT_BATCHES = 16
+
     def __init__(
         self,
         host: str = "http://localhost:8080",
         auth_token: Optional[str] = None,
         index_name: str = "cs_interview_docs",
-        dimension: int = 384
+        dimension: int = 384,
+        upsert_batch_size: Optional[int] = None,
+        store_full_content: bool = True,
+        dedup_cache_path: Optional[str] = None
     ):
         """
         Initialize the Endee vector store.
-        
+
         Args:
             host: Endee server URL
             auth_token: Optional authentication token
             index_name: Name of the vector index
             dimension: Dimension of embedding vectors
+            upsert_batch_size: Vectors per upsert request; defaults to a
+                size computed from the dimension and a target payload of
+                ~16 MB per request
+            store_full_content: If True (the default), ship the full
+                chunk content in each vector's metadata so search
+                results are self-contained across processes -- the CLI
+                ingests and queries in separate runs. Set False to
+                roughly halve payload and server-side storage for
+                workloads that only need ids, scores and previews
+            dedup_cache_path: Optional path to a shelve database of
+                content hashes. When set, re-ingesting unchanged
+                documents skips the vectors whose content hash already
+                matches, so repeat ingests only pay for what changed
         """
         try:
             from endee import Endee, Precision
@@ -61,8 +112,174 @@ class EndeeVectorStore:
         
         # Set base URL
         self.client.set_base_url(f"{host}/api/v1")
-        
-        self._index = None
+
+        # Keep-alive layer: one pooled session shared by the main
+        # thread and the upsert workers, so requests reuse TCP
+        # connections instead of paying a handshake each
+        self._session = None
+        self._install_session(self.client)
+        serializer_ready = self._install_serializer(self.client)
+
+        # Quantize vectors to int8 client-side before transport. The index
+        # is created with Precision.INT8D, so sending float32 lists just
+        # forces a server-side requantization on every upsert. Raw int8
+        # bytes only survive serialization through the orjson hook's
+        # base64 default, so without it vectors travel as float lists.
+        self.int8_transport = serializer_ready
+        self.upsert_batch_size = upsert_batch_size
+        self.store_full_content = store_full_content
+
+        # Quantize query vectors the same way; flips itself off when the
+        # client's query() signature rejects the typed payload
+        self._int8_query = serializer_ready
+
+        # (timestamp, names) cache for list_indexes; the existence check
+        # in create_index is otherwise a full HTTP round-trip per call
+        self._indexes_cache: Optional[tuple] = None
+
+        # Content-hash dedup store (opened lazily; shelve drags in dbm)
+        self.dedup_cache_path = dedup_cache_path
+        self._dedup_db_handle = None
+
+        # Bind the index handle eagerly so hot paths (search, upsert)
+        # skip the None-check indirection; stays None if the index does
+        # not exist yet and is re-resolved lazily by _ensure_index
+        try:
+            self._index = self.client.get_index(name=index_name)
+        except Exception:
+            self._index = None
+
+    # Target request payload for upserts; tiny batches waste the fixed
+    # HTTP/TLS framing cost, huge ones hit server-side request caps
+    UPSERT_TARGET_BYTES = 16 * 1024 * 1024
+
+    def _http_session(self):
+        """Return the store's pooled requests.Session, creating it on
+        first use.
+
+        One session is shared across threads deliberately, the same
+        trade the module-level session in _http.py makes: urllib3's
+        connection pool underneath is thread-safe, and the store only
+        issues independent request/response cycles through it (no
+        cookies or per-request session mutation).
+        """
+        session = self._session
+        if session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=64,
+                max_retries=3
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return session
+
+    def _install_session(self, client) -> None:
+        """Best-effort: point the Endee client at the pooled session.
+
+        The endee client doesn't document a transport hook, so try the
+        common attribute names -- but only replace an attribute that
+        already holds a requests.Session, so a different transport
+        (an httpx client, a vendor wrapper) is never swapped for an
+        object its caller can't use. If nothing matches the client
+        keeps its own transport and we simply lose keep-alive, not
+        correctness.
+        """
+        import requests
+
+        session = self._http_session()
+        for attr in ("session", "_session", "http"):
+            if isinstance(getattr(client, attr, None), requests.Session):
+                try:
+                    setattr(client, attr, session)
+                    return
+                except Exception:
+                    continue
+
+    def _install_serializer(self, client) -> bool:
+        """Best-effort: swap the client's JSON encoder for orjson.
+
+        orjson serializes large upsert payloads several times faster
+        than the stdlib json module and handles numpy scalars natively.
+        Int8 transport puts raw bytes in vector records, which no JSON
+        encoder accepts, so those are base64-encoded -- the
+        conventional framing for binary fields in JSON APIs.
+        Like _install_session, this probes common attribute names; if
+        orjson is missing or the client exposes no hook, the stdlib
+        encoder stays in place.
+
+        Returns:
+            True if the hook was installed; the caller gates int8
+            transport on this, since only the installed encoder knows
+            how to frame raw bytes
+        """
+        try:
+            import orjson
+        except ImportError:
+            return False
+
+        def _default(obj):
+            if isinstance(obj, bytes):
+                return base64.b64encode(obj).decode("ascii")
+            raise TypeError(
+                f"Object of type {type(obj).__name__} is not JSON serializable"
+            )
+
+        def dumps(obj) -> str:
+            return orjson.dumps(
+                obj, option=orjson.OPT_SERIALIZE_NUMPY, default=_default
+            ).decode("utf-8")
+
+        for attr in ("serializer", "_serializer", "json_dumps", "_json_dumps"):
+            if hasattr(client, attr):
+                try:
+                    setattr(client, attr, dumps)
+                    return True
+                except Exception:
+                    continue
+        return False
+
+    def _default_upsert_batch_size(self) -> int:
+        """Batch size that lands near the target payload per request."""
+        bytes_per_vector = self.dimension if self.int8_transport else self.dimension * 4
+        # +512 approximates per-record metadata overhead
+        return max(100, min(5000, self.UPSERT_TARGET_BYTES // (bytes_per_vector + 512)))
+
+    @staticmethod
+    def _quantize_int8(emb: np.ndarray):
+        """
+        Quantize rows of a float32 array to int8 with per-vector scale/shift.
+
+        Each row dequantizes as: x = (q + 128) * scale + shift, with q in
+        [-128, 127] covering the row's [min, max] range.
+
+        Args:
+            emb: Float32 array of shape (N, dimension)
+
+        Returns:
+            Tuple (q, scales, shifts) where q is int8 of the same shape and
+            scales/shifts are 1-D float arrays of length N
+        """
+        mn = emb.min(axis=1, keepdims=True)
+        mx = emb.max(axis=1, keepdims=True)
+        scale = np.maximum((mx - mn) / 255.0, 1e-12)
+        q = (np.round((emb - mn) / scale) - 128.0).astype(np.int8)
+        return q, scale.ravel(), mn.ravel()
+
+    def _quantize_query(self, vector) -> tuple:
+        """Quantize one query vector with the same scheme as upserts.
+
+        Returns:
+            Tuple (int8_bytes, scale, shift)
+        """
+        arr = np.asarray(vector, dtype=np.float32).reshape(1, -1)
+        q, scales, shifts = self._quantize_int8(arr)
+        return q[0].tobytes(), float(scales[0]), float(shifts[0])
     
     def create_index(self, recreate: bool = False) -> None:
         """
@@ -73,31 +290,23 @@ class EndeeVectorStore:
         """
         # Check if index exists
         try:
-            existing_indexes = self.client.list_indexes()
-            # list_indexes() returns a list of index names (strings) or dicts
-            if existing_indexes:
-                if isinstance(existing_indexes[0], dict):
-                    index_names = [idx.get("name") for idx in existing_indexes]
-                else:
-                    index_names = existing_indexes  # Already a list of strings
-            else:
-                index_names = []
-            index_exists = self.index_name in index_names
+            index_exists = self.index_name in self._list_index_names()
         except Exception as e:
-            print(f"Note: Could not list indexes ({e}), will try to create")
+            logger.warning("Could not list indexes (%s), will try to create", e)
             index_exists = False
         
         if index_exists:
             if recreate:
-                print(f"Deleting existing index: {self.index_name}")
+                logger.info("Deleting existing index: %s", self.index_name)
                 self.client.delete_index(name=self.index_name)
+                self._indexes_cache = None
             else:
-                print(f"Index '{self.index_name}' already exists")
+                logger.info("Index '%s' already exists", self.index_name)
                 self._index = self.client.get_index(name=self.index_name)
                 return
         
         # Create new index with cosine similarity and INT8D precision
-        print(f"Creating index: {self.index_name} (dimension: {self.dimension})")
+        logger.info("Creating index: %s (dimension: %d)", self.index_name, self.dimension)
         self.client.create_index(
             name=self.index_name,
             dimension=self.dimension,
@@ -105,135 +314,575 @@ class EndeeVectorStore:
             precision=self.Precision.INT8D
         )
         
+        self._indexes_cache = None
         self._index = self.client.get_index(name=self.index_name)
-        print(f"Index '{self.index_name}' created successfully")
+        logger.info("Index '%s' created successfully", self.index_name)
     
-    def _get_index(self):
-        """Get the index, creating if necessary."""
+    # How long a cached list_indexes() result stays fresh
+    INDEXES_CACHE_TTL = 5.0
+
+    def _list_index_names(self) -> List[str]:
+        """List index names, memoized for INDEXES_CACHE_TTL seconds.
+
+        Returns:
+            List of index names known to the server
+        """
+        now = time.monotonic()
+        cached = self._indexes_cache
+        if cached is not None and now - cached[0] < self.INDEXES_CACHE_TTL:
+            return cached[1]
+
+        existing_indexes = self.client.list_indexes()
+        # list_indexes() returns a list of index names (strings) or dicts
+        if existing_indexes and isinstance(existing_indexes[0], dict):
+            index_names = [idx.get("name") for idx in existing_indexes]
+        else:
+            index_names = list(existing_indexes or [])
+        self._indexes_cache = (now, index_names)
+        return index_names
+
+    def _ensure_index(self):
+        """Cold path: resolve and cache the index handle."""
         if self._index is None:
             self._index = self.client.get_index(name=self.index_name)
         return self._index
     
+    def _dedup_db(self):
+        """Open the shelve-backed hash store on first use."""
+        if self._dedup_db_handle is None:
+            import shelve
+            self._dedup_db_handle = shelve.open(self.dedup_cache_path)
+        return self._dedup_db_handle
+
+    def _dedup_filter(self, chunks: List[Any], emb: np.ndarray):
+        """Drop chunks whose content hash matches the dedup store.
+
+        Args:
+            chunks: List of Chunk objects
+            emb: Float32 array of shape (len(chunks), dimension)
+
+        Returns:
+            Tuple (kept_chunks, kept_emb, pending_hashes) where
+            pending_hashes maps vector id -> content hash for the kept
+            chunks, to be committed after a successful upsert
+        """
+        db = self._dedup_db()
+        kept_rows = []
+        pending = {}
+        for i, chunk in enumerate(chunks):
+            key = getattr(chunk, "vector_id", None) \
+                or f"{chunk.source}_chunk_{chunk.chunk_id}"
+            digest = hashlib.blake2b(
+                chunk.content.encode("utf-8"), digest_size=16
+            ).hexdigest()
+            if db.get(key) == digest:
+                continue
+            kept_rows.append(i)
+            pending[key] = digest
+
+        if len(kept_rows) == len(chunks):
+            return chunks, emb, pending
+        return [chunks[i] for i in kept_rows], emb[kept_rows], pending
+
+    def _commit_dedup(self, pending_hashes: Dict[str, str]) -> None:
+        """Record content hashes after their vectors landed server-side."""
+        db = self._dedup_db()
+        db.update(pending_hashes)
+        db.sync()
+
+    def _build_records(self, chunks: List[Any], emb: np.ndarray, int8: bool) -> List[Dict[str, Any]]:
+        """Build upsert record dicts for a batch of chunks.
+
+        Builds the payload pieces in tight comprehensions: one attrgetter
+        call per chunk, then ids/previews/metas each in a single pass,
+        which keeps attribute lookups in CPython's inline caches.
+
+        Args:
+            chunks: List of Chunk objects
+            emb: Float32 array of shape (len(chunks), dimension)
+            int8: If True, vectors are quantized to int8 bytes with
+                per-record scale/shift; otherwise they travel as
+                JSON-friendly float lists
+
+        Returns:
+            List of record dicts ready for upsert
+        """
+        attrs = [_chunk_fields(c) for c in chunks]
+        # Chunks carry a precomputed vector_id; the f-string fallback
+        # covers chunk-like objects built elsewhere
+        ids = [
+            getattr(c, "vector_id", None) or f"{attrs[i][0]}_chunk_{attrs[i][1]}"
+            for i, c in enumerate(chunks)
+        ]
+        previews = [
+            content[:200] + "..." if len(content) > 200 else content
+            for _, _, content, _, _ in attrs
+        ]
+        metas = [
+            {
+                "source": source,
+                "chunk_id": chunk_id,
+                "content_preview": previews[i],
+                "start_char": start_char,
+                "end_char": end_char
+            }
+            for i, (source, chunk_id, content, start_char, end_char) in enumerate(attrs)
+        ]
+
+        # Full content roughly doubles every metadata payload; callers
+        # that opted out get previews only (no client-side copy is kept,
+        # so streaming ingests stay at O(batch) memory)
+        if self.store_full_content:
+            for meta, (_, _, content, _, _) in zip(metas, attrs):
+                meta["content"] = content
+
+        if int8:
+            q, scales, shifts = self._quantize_int8(emb)
+            return [
+                {
+                    "id": ids[i],
+                    "vector": q[i].tobytes(),
+                    "scale": float(scales[i]),
+                    "shift": float(shifts[i]),
+                    "meta": metas[i],
+                    "filter": {"source": attrs[i][0]}
+                }
+                for i in range(len(chunks))
+            ]
+        return [
+            {
+                "id": ids[i],
+                "vector": emb[i].tolist(),
+                "meta": metas[i],
+                "filter": {"source": attrs[i][0]}
+            }
+            for i in range(len(chunks))
+        ]
+
+    @staticmethod
+    def _iter_batches(chunks, embeddings, batch_size: int):
+        """Pair chunks with embedding rows and yield them in batches.
+
+        Accepts any iterables; a numpy array iterates row-by-row, so
+        sized and streaming inputs go through the same path.
+
+        Yields:
+            Tuples (chunk_batch, emb_batch) of parallel lists with up to
+            batch_size items each
+        """
+        paired = zip(chunks, embeddings)
+        while True:
+            batch = list(islice(paired, batch_size))
+            if not batch:
+                return
+            yield [c for c, _ in batch], [e for _, e in batch]
+
     def upsert_chunks(
         self,
-        chunks: List[Any],
-        embeddings: List[List[float]]
+        chunks,
+        embeddings: Union[np.ndarray, List[List[float]]]
     ) -> int:
         """
         Upsert chunks with their embeddings into Endee.
-        
+
+        Chunks and embeddings may be any iterables (lists, arrays or
+        generators): records are built one upsert batch at a time, so
+        peak memory is bounded by the in-flight batches rather than the
+        whole corpus.
+
         Args:
-            chunks: List of Chunk objects
-            embeddings: List of embedding vectors
-            
+            chunks: Iterable of Chunk objects
+            embeddings: Embedding vectors as a (N, dimension) numpy array,
+                a list of lists of floats, or an iterable of rows
+
         Returns:
             Number of vectors upserted
         """
-        if len(chunks) != len(embeddings):
-            raise ValueError("Number of chunks and embeddings must match")
-        
-        if not chunks:
-            return 0
-        
-        index = self._get_index()
-        
-        # Prepare vectors for upsert
-        vectors = []
-        for chunk, embedding in zip(chunks, embeddings):
-            # Generate unique ID from source and chunk_id
-            vector_id = f"{chunk.source}_chunk_{chunk.chunk_id}"
-            
-            # Create content preview (first 200 chars)
-            content_preview = chunk.content[:200] + "..." if len(chunk.content) > 200 else chunk.content
-            
-            vectors.append({
-                "id": vector_id,
-                "vector": embedding,
-                "meta": {
-                    "source": chunk.source,
-                    "chunk_id": chunk.chunk_id,
-                    "content": chunk.content,
-                    "content_preview": content_preview,
-                    "start_char": chunk.start_char,
-                    "end_char": chunk.end_char
-                },
-                "filter": {
-                    "source": chunk.source
-                }
-            })
-        
-        # Upsert in batches of 100
-        batch_size = 100
+        # Length check only when both sides know their size; generators
+        # are trusted to be parallel (zip stops at the shorter one)
+        if hasattr(chunks, "__len__") and hasattr(embeddings, "__len__"):
+            if len(chunks) != len(embeddings):
+                raise ValueError("Number of chunks and embeddings must match")
+
+        # Fast path: the handle is already bound; fall back once if not
+        index = self._index
+        if index is None:
+            index = self._ensure_index()
+
+        # Upsert batches concurrently: each HTTP round-trip is mostly
+        # waiting on the server, so in-flight batches scale throughput
+        # until Endee saturates. The bounded semaphore caps in-flight
+        # payload memory at O(workers * batch_size), and record building
+        # happens per batch so nothing accumulates beyond that.
+        batch_size = self.upsert_batch_size or self._default_upsert_batch_size()
+        total_submitted = 0
         total_upserted = 0
-        
-        for i in range(0, len(vectors), batch_size):
-            batch = vectors[i:i + batch_size]
-            index.upsert(batch)
-            total_upserted += len(batch)
-            print(f"  Upserted {total_upserted}/{len(vectors)} vectors")
-        
+        pending_hashes: Dict[str, str] = {}
+        in_flight = threading.BoundedSemaphore(self.MAX_INFLIGHT_BATCHES)
+
+        def _upsert_batch(batch):
+            try:
+                index.upsert(batch)
+                return len(batch)
+            finally:
+                in_flight.release()
+
+        futures = []
+        with ThreadPoolExecutor(max_workers=self.UPSERT_WORKERS) as pool:
+            for chunk_batch, emb_batch in self._iter_batches(chunks, embeddings, batch_size):
+                emb = np.asarray(emb_batch, dtype=np.float32)
+
+                # Validate shape per batch; catching a bad dimension
+                # here beats finding out after a full HTTP round-trip
+                if emb.ndim != 2 or emb.shape[1] != self.dimension:
+                    raise ValueError(
+                        f"Expected embeddings of shape (N, {self.dimension}), "
+                        f"got {emb.shape}"
+                    )
+
+                # Skip vectors whose content is byte-identical to the
+                # last successful ingest; hashes are only committed
+                # after the upsert so a failure re-sends everything
+                if self.dedup_cache_path:
+                    chunk_batch, emb, batch_hashes = self._dedup_filter(chunk_batch, emb)
+                    pending_hashes.update(batch_hashes)
+                    if not chunk_batch:
+                        continue
+
+                # Block record building, not just submission, while the
+                # pipeline is full; this is what bounds peak memory
+                in_flight.acquire()
+                records = self._build_records(chunk_batch, emb, int8=self.int8_transport)
+                total_submitted += len(records)
+                futures.append(pool.submit(_upsert_batch, records))
+
+            # Progress is rate-limited to ~1 Hz so stdout/handler I/O
+            # never synchronizes the worker threads
+            last_log = time.monotonic()
+            for future in as_completed(futures):
+                total_upserted += future.result()
+                now = time.monotonic()
+                if total_upserted == total_submitted or now - last_log >= 1.0:
+                    logger.debug(
+                        "Upserted %d/%d vectors", total_upserted, total_submitted
+                    )
+                    last_log = now
+
+        if pending_hashes:
+            self._commit_dedup(pending_hashes)
+
         return total_upserted
     
     def search(
         self,
-        query_vector: List[float],
+        query_vector: Union[np.ndarray, List[float]],
         top_k: int = 5,
-        source_filter: Optional[str] = None
+        source_filter: Optional[str] = None,
+        ef: Optional[int] = None,
+        ef_multiplier: int = 8,
+        ef_floor: int = 64,
+        projection: frozenset = frozenset(
+            {"id", "content", "source", "similarity", "metadata"}
+        )
     ) -> List[SearchResult]:
         """
         Search for similar vectors in Endee.
-        
+
+        HNSW search cost grows with ef while recall scales with
+        ef/top_k, so a fixed ef is wasteful for small top_k and starves
+        recall for large top_k. By default ef is derived from top_k;
+        index-time M/efConstruction are unaffected.
+
         Args:
-            query_vector: The query embedding vector
+            query_vector: The query embedding vector (numpy array or list)
             top_k: Number of results to return
             source_filter: Optional filter by source document
-            
+            ef: Explicit HNSW ef override; defaults to
+                max(ef_floor, top_k * ef_multiplier)
+            ef_multiplier: Scale factor applied to top_k when ef is None
+            ef_floor: Minimum ef when ef is None
+            projection: Fields the caller actually needs. Passing
+                frozenset({"id", "similarity"}) skips content
+                rehydration and SearchResult construction entirely
+
         Returns:
-            List of SearchResult objects
+            List of SearchResult objects, or (id, similarity) tuples
+            when projection is exactly {"id", "similarity"}
         """
-        index = self._get_index()
-        
-        # Build query parameters
+        # Fast path: the handle is already bound; fall back once if not
+        index = self._index
+        if index is None:
+            index = self._ensure_index()
+
+        # Build query parameters. Quantizing client-side matches the
+        # INT8D index precision, so the server skips a per-query
+        # float32 -> int8 conversion and the request body shrinks 4x.
+        if ef is None:
+            ef = max(ef_floor, top_k * ef_multiplier)
+
+        results = None
+        if self._int8_query:
+            q_bytes, scale, shift = self._quantize_query(query_vector)
+            query_params = {
+                "vector": q_bytes,
+                "scale": scale,
+                "shift": shift,
+                "top_k": top_k,
+                "ef": ef
+            }
+            if source_filter:
+                query_params["filter"] = list(_build_source_filter(source_filter))
+            try:
+                results = index.query(**query_params)
+            except TypeError:
+                # Client's query() doesn't take the typed payload;
+                # remember so later queries skip the failed attempt
+                self._int8_query = False
+
+        if results is None:
+            if isinstance(query_vector, np.ndarray):
+                query_vector = query_vector.tolist()
+            query_params = {
+                "vector": query_vector,
+                "top_k": top_k,
+                "ef": ef
+            }
+            if source_filter:
+                query_params["filter"] = list(_build_source_filter(source_filter))
+            results = index.query(**query_params)
+
+        # Fast path for rerankers/evaluators that only score ids: no
+        # cache lookups, no SearchResult allocation per hit
+        if projection == _ID_SIMILARITY:
+            return [
+                (item.get("id", ""), item.get("similarity", 0.0))
+                for item in results
+            ]
+
+        return self._to_search_results(results)
+
+    def search_batch(
+        self,
+        query_vectors: Union[np.ndarray, List[List[float]]],
+        top_k: int = 5,
+        source_filter: Optional[str] = None
+    ) -> List[List[SearchResult]]:
+        """
+        Search for several query vectors in one call.
+
+        Tries the index's native multi-vector query first (one HTTP
+        round-trip for the whole batch); if the installed endee client
+        doesn't support it, falls back to fanning the queries out over
+        a thread pool so they at least overlap their network waits.
+
+        Args:
+            query_vectors: Query embeddings as a (N, dimension) array or
+                list of vectors
+            top_k: Number of results to return per query
+            source_filter: Optional filter by source document
+
+        Returns:
+            One list of SearchResult objects per query vector, in order
+        """
+        vectors = np.asarray(query_vectors, dtype=np.float32)
+        if vectors.ndim != 2:
+            raise ValueError(f"Expected query vectors of shape (N, dim), got {vectors.shape}")
+        if vectors.shape[0] == 0:
+            return []
+
+        index = self._index
+        if index is None:
+            index = self._ensure_index()
+
         query_params = {
-            "vector": query_vector,
-            "top_k": top_k,
-            "ef": 128  # Higher ef for better recall
+            "vectors": [v.tolist() for v in vectors],
+            "top_k": top_k
         }
-        
-        # Add filter if specified
         if source_filter:
-            query_params["filter"] = [{"source": {"$eq": source_filter}}]
-        
-        # Execute search
-        results = index.query(**query_params)
-        
-        # Convert to SearchResult objects
+            query_params["filter"] = list(_build_source_filter(source_filter))
+
+        try:
+            results = index.query(**query_params)
+        except TypeError:
+            # Client predates multi-vector queries; overlap the
+            # round-trips instead
+            with ThreadPoolExecutor(max_workers=min(8, len(vectors))) as pool:
+                return list(pool.map(
+                    lambda v: self.search(v, top_k=top_k, source_filter=source_filter),
+                    vectors
+                ))
+
+        return [self._to_search_results(per_query) for per_query in results]
+
+    def _to_search_results(self, results) -> List[SearchResult]:
+        """Convert raw query result dicts to SearchResult objects,
+        falling back to the stored preview for indexes ingested with
+        store_full_content=False."""
         search_results = []
         for item in results:
             meta = item.get("meta", {})
+            # EAFP: full content is the common case under the default
+            # store_full_content=True
+            try:
+                content = meta["content"]
+            except KeyError:
+                content = meta.get("content_preview", "")
             search_results.append(SearchResult(
                 id=item.get("id", ""),
                 similarity=item.get("similarity", 0.0),
-                content=meta.get("content", ""),
+                content=content,
                 source=meta.get("source", ""),
                 metadata=meta
             ))
-        
+
         return search_results
     
+    def _async_client(self):
+        """Return the shared httpx.AsyncClient, created on first use.
+
+        httpx is only needed by the async API, so the import stays
+        inside this method.
+        """
+        client = getattr(self, "_aclient", None)
+        if client is None:
+            try:
+                import httpx
+            except ImportError:
+                raise ImportError(
+                    "httpx is required for async search/upsert. "
+                    "Install with: pip install httpx[http2]"
+                )
+
+            headers = {}
+            if self.auth_token:
+                headers["Authorization"] = f"Bearer {self.auth_token}"
+            client = httpx.AsyncClient(
+                base_url=f"{self.host}/api/v1",
+                http2=True,
+                headers=headers,
+                limits=httpx.Limits(max_connections=256),
+                timeout=30.0
+            )
+            self._aclient = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client if one was created."""
+        client = getattr(self, "_aclient", None)
+        if client is not None:
+            self._aclient = None
+            await client.aclose()
+
+    async def asearch(
+        self,
+        query_vector: Union[np.ndarray, List[float]],
+        top_k: int = 5,
+        source_filter: Optional[str] = None,
+        ef: Optional[int] = None,
+        ef_multiplier: int = 8,
+        ef_floor: int = 64
+    ) -> List[SearchResult]:
+        """
+        Async variant of search, talking to Endee's REST API directly
+        over a pooled httpx.AsyncClient. Lets callers overlap many
+        queries on one event loop instead of one blocked thread each.
+
+        Vectors travel as float lists here: the int8 byte framing is an
+        endee-client transport detail that the plain REST endpoint does
+        not accept.
+
+        Args: same as search.
+
+        Returns:
+            List of SearchResult objects
+        """
+        if ef is None:
+            ef = max(ef_floor, top_k * ef_multiplier)
+
+        if isinstance(query_vector, np.ndarray):
+            query_vector = query_vector.tolist()
+        payload = {"vector": query_vector, "top_k": top_k, "ef": ef}
+        if source_filter:
+            payload["filter"] = list(_build_source_filter(source_filter))
+
+        client = self._async_client()
+        response = await client.post(
+            f"/index/{self.index_name}/query", json=payload
+        )
+        response.raise_for_status()
+        body = response.json()
+        results = body.get("results", body) if isinstance(body, dict) else body
+        return self._to_search_results(results)
+
+    async def aupsert_chunks(
+        self,
+        chunks: List[Any],
+        embeddings: Union[np.ndarray, List[List[float]]]
+    ) -> int:
+        """
+        Async variant of upsert_chunks over the REST API. Batches are
+        posted concurrently on the event loop with the same in-flight
+        cap as the threaded path.
+
+        Args: same as upsert_chunks.
+
+        Returns:
+            Number of vectors upserted
+        """
+        import asyncio
+
+        if len(chunks) != len(embeddings):
+            raise ValueError("Number of chunks and embeddings must match")
+
+        if not chunks:
+            return 0
+
+        emb = np.asarray(embeddings, dtype=np.float32)
+        if emb.ndim != 2 or emb.shape[1] != self.dimension:
+            raise ValueError(
+                f"Expected embeddings of shape (N, {self.dimension}), "
+                f"got {emb.shape}"
+            )
+
+        # Float-list records: the REST endpoint takes JSON, not the
+        # endee client's int8 byte framing
+        vectors = self._build_records(chunks, emb, int8=False)
+
+        client = self._async_client()
+        batch_size = self.upsert_batch_size or self._default_upsert_batch_size()
+        in_flight = asyncio.Semaphore(self.MAX_INFLIGHT_BATCHES)
+
+        async def _post_batch(batch):
+            async with in_flight:
+                response = await client.post(
+                    f"/index/{self.index_name}/upsert",
+                    json={"vectors": batch}
+                )
+                response.raise_for_status()
+                return len(batch)
+
+        counts = await asyncio.gather(*(
+            _post_batch(vectors[i:i + batch_size])
+            for i in range(0, len(vectors), batch_size)
+        ))
+        total_upserted = sum(counts)
+        logger.debug("Upserted %d/%d vectors", total_upserted, len(vectors))
+        return total_upserted
+
     def delete_index(self) -> None:
         """Delete the vector index."""
         try:
             self.client.delete_index(name=self.index_name)
             self._index = None
-            print(f"Index '{self.index_name}' deleted")
+            self._indexes_cache = None
+            logger.info("Index '%s' deleted", self.index_name)
         except Exception as e:
-            print(f"Could not delete index: {e}")
+            logger.warning("Could not delete index: %s", e)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get index statistics."""
         try:
-            index = self._get_index()
+            index = self._ensure_index()
             info = index.describe()
             return info
         except Exception as e: